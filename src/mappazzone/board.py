@@ -1,13 +1,14 @@
 """This module provides classes for a game board, consisting of a grid of locations."""
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+import itertools
 import logging
 
 from .locations import Direction, Location
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Invalid:
     """
     A witness of a violation of the board invariant.
@@ -72,6 +73,13 @@ class Board:
     grid: List
     opts: BoardOptions
 
+    # For each direction, and for each column (LONGITUDE) or row (LATITUDE),
+    # the indexes, within the column or row, of the earliest and the latest
+    # location along that direction (None if the column or row is empty).
+    _bounds: Dict[Direction, List[Optional[Tuple[int, int]]]]
+    # Number of locations on the board.
+    _placed: int
+
     _logger: logging.Logger
 
     def __init__(self, center: Location, options: BoardOptions):
@@ -86,18 +94,18 @@ class Board:
                                        tolerance=tolerance, wrap=wrap)
         self.grid = [[None for _ in range(self.opts.size)]
                      for _ in range(self.opts.size)]
-        self.grid[self.opts.center_x][self.opts.center_y] = center
+        self._bounds = {direction: [None] * self.opts.size for direction in Direction}
+        self._placed = 0
+        self.set_center(center)
         self._logger.debug('Initialized board with size: %s', self.opts.size)
 
     def __str__(self) -> str:
         """Representation of the board as a list of the locations at each position."""
-        result = [f'Grid {self.opts.size}x{self.opts.size}:']
-        # pylint: disable=invalid-name  # x and y are valid names for coordinate variables.
-        for x in range(self.opts.size):
-            for y in range(self.opts.size):
-                location = self.get(x, y)
-                result += [f'x={x}, y={y}: {location}']
-        return '\n'.join(result)
+        size = self.opts.size
+        cells = (f'x={x}, y={y}: {location}'
+                 for x, col in enumerate(self.grid)
+                 for y, location in enumerate(col))
+        return '\n'.join(itertools.chain([f'Grid {size}x{size}:'], cells))
 
     def log_setup(self):
         """Set up logger for this class."""
@@ -105,7 +113,7 @@ class Board:
 
     def set_center(self, center: Location):
         """Set the center location of the board."""
-        self.grid[self.opts.center_x][self.opts.center_y] = center
+        self.put(center, self.opts.center_x, self.opts.center_y, force=True)
 
     def get_center(self) -> Location:
         """Return the center location of the board."""
@@ -134,20 +142,62 @@ class Board:
         """Place `location` at absolute coordinates `x`, `y` without
         checking invariant.  Fail if `x` or `y` are out of bound, or
         if not `force` and the position is already occupied."""
-        current = self.get(x=x, y=y)
+        if not (0 <= x < self.opts.size and 0 <= y < self.opts.size):
+            raise ValueError(f'Position: {x}, {y} is out of bounds')
+        col = self.grid[x]
+        current = col[y]
         if not force:
             assert current is None, f'Position {x}, {y} is occupied'
-        self.grid[x][y] = location
+        self._placed += (location is not None) - (current is not None)
+        col[y] = location
+        self._update_bounds(x, y)
 
     def remove(self, x: int, y: int):
         """Remove location at absolute coordinates `x`, `y`."""
         self.put(None, x, y, force=True)
 
+    # pylint: disable=invalid-name  # x and y are valid names for coordinate variables.
+    def _update_bounds(self, x: int, y: int):
+        """Recompute the bounds of column `x` and row `y`, after the
+        location at absolute coordinates `x`, `y` has changed."""
+        for direction, m in ((Direction.LONGITUDE, x), (Direction.LATITUDE, y)):
+            first, last = None, None
+            line = self._line(direction, m)
+            for n, location in enumerate(line):
+                if location is None:
+                    continue
+                if first is None:
+                    first, last = n, n
+                    continue
+                if location.before(line[first], direction, 0.0):
+                    first = n
+                if line[last].before(location, direction, 0.0):
+                    last = n
+            self._bounds[direction][m] = None if first is None else (first, last)
+
+    def _cell(self, direction: Direction, m: int, n: int) -> Tuple[int, int]:
+        """Absolute coordinates of the `n`-th cell in the `m`-th column
+        (if `direction` is LONGITUDE) or row (if `direction` is LATITUDE)."""
+        return (m, n) if direction == Direction.LONGITUDE else (n, m)
+
+    def _at(self, direction: Direction, m: int, n: int) -> Optional[Location]:
+        """Location in the `n`-th cell in the `m`-th column
+        (if `direction` is LONGITUDE) or row (if `direction` is LATITUDE)."""
+        return self.grid[m][n] if direction == Direction.LONGITUDE else self.grid[n][m]
+
+    def _line(self, direction: Direction, m: int) -> List[Optional[Location]]:
+        """Cells in the `m`-th column (if `direction` is LONGITUDE)
+        or row (if `direction` is LATITUDE)."""
+        if direction == Direction.LONGITUDE:
+            return self.grid[m]
+        if direction == Direction.LATITUDE:
+            return [col[m] for col in self.grid]
+        raise ValueError(f'Invalid direction: {direction}')
+
     def placed(self) -> int:
         """Number of locations placed on the board (including the center)."""
-        return len([cell for row in self.grid for cell in row if cell is not None])
+        return self._placed
 
-    # pylint: disable=too-many-locals  # The invariant involves many (quantified) variables.
     def violations(self, direction: Optional[Direction] = None) -> List[Invalid]:
         """
         Check the invariant and return [] if it holds. Otherwise,
@@ -166,58 +216,93 @@ class Board:
              (grid[x1][y1] != None and grid[x1][y1] != None
               ==> 
               grid[x1][y1].latitude.before(grid[x2][y2]))
+
+        Since `before` is monotonic in the coordinates, it is enough to scan
+        the columns (resp. rows) in order, and to check each location against
+        the witness with the largest longitude (resp. smallest latitude) among
+        the locations in the same or in previous columns (resp. rows).
         """
         if direction is None:
             val_lng = self.violations(Direction.LONGITUDE)
             val_lat = self.violations(Direction.LATITUDE)
             return val_lng + val_lat
-        checked = set([])
-        for m1 in range(self.opts.size):
-            for m2 in range(m1, self.opts.size):
-                for n1 in range(self.opts.size):
-                    for n2 in range(self.opts.size):
-                        if direction == Direction.LONGITUDE:
-                            x1, y1, x2, y2 = m1, n1, m2, n2
-                        elif direction == Direction.LATITUDE:
-                            x1, y1, x2, y2 = n1, m1, n2, m2
-                        check = (x1, y1, x2, y2)
-                        if check in checked:
-                            continue
-                        checked.add(check)
-                        first, second = self.grid[x1][y1], self.grid[x2][y2]
-                        if first is None or second is None:
-                            continue
-                        if first.before(second, direction, self.opts.tolerance):
-                            continue
-                        return [Invalid(direction,
-                                        x1, y1, x2, y2,
-                                        first, second)]
+        tolerance = self.opts.tolerance
+        witness_loc, witness_cell = None, None
+        for m in range(self.opts.size):
+            line = [(n, loc) for n, loc in enumerate(self._line(direction, m))
+                    if loc is not None]
+            if not line:
+                continue
+            for n, location in line:
+                if witness_loc is None or witness_loc.before(location, direction, 0.0):
+                    witness_loc, witness_cell = location, self._cell(direction, m, n)
+            for n, location in line:
+                if witness_loc.before(location, direction, tolerance):
+                    continue
+                return [Invalid(direction,
+                                *witness_cell, *self._cell(direction, m, n),
+                                witness_loc, location)]
+        return []
+
+    # pylint: disable=invalid-name  # x and y are valid names for coordinate variables.
+    def _violations_at(self, location: Location, x: int, y: int,
+                       direction: Optional[Direction] = None) -> List[Invalid]:
+        """
+        Check whether placing `location` at absolute coordinates `x`, `y`
+        would break the invariant, and return a list of the first `Invalid`
+        violations involving `location` (or [] if there are none).
+
+        The grid is not modified, and position `x`, `y` should be free.
+        Assuming that the invariant holds for the locations already on the
+        board, it suffices to compare `location` with the latest location
+        in each previous column (resp. row), and with the earliest location
+        in each following column (resp. row).
+        """
+        if direction is None:
+            val_lng = self._violations_at(location, x, y, Direction.LONGITUDE)
+            val_lat = self._violations_at(location, x, y, Direction.LATITUDE)
+            return val_lng + val_lat
+        if direction == Direction.LONGITUDE:
+            pos = x
+        elif direction == Direction.LATITUDE:
+            pos = y
+        else:
+            raise ValueError(f'Invalid direction: {direction}')
+        tolerance = self.opts.tolerance
+        for m, bounds in enumerate(self._bounds[direction]):
+            if bounds is None:
+                continue
+            first, last = bounds
+            if m <= pos:
+                other = self._at(direction, m, last)
+                if not other.before(location, direction, tolerance):
+                    return [Invalid(direction, *self._cell(direction, m, last), x, y,
+                                    other, location)]
+            if pos <= m:
+                other = self._at(direction, m, first)
+                if not location.before(other, direction, tolerance):
+                    return [Invalid(direction, x, y, *self._cell(direction, m, first),
+                                    location, other)]
         return []
 
     def try_place(self, location: Location, x: int, y: int, place: bool = True) -> List[Direction]:
         """Try to place `location` at absolute coordinates `x`, `y` on
         the board. If doing so does not break the invariant, return
-        []. Otherwise, removes `location` from the board and return a
+        []. Otherwise, leave the board unchanged and return a
         list of directions where the placement would have violated the
-        invariant. If `place` is True, `location` will not be placed 
+        invariant. If `place` is False, `location` will not be placed 
         on the board even if it does not break the invariant."""
         self._logger.debug('Try placement of %s at x=%s, y=%s', location, x, y)
         current = self.get(x=x, y=y)
         if current is not None:
             self._logger.debug('Position: x=%s, y=%s is occupied', x, y)
             raise ValueError(f'Position: {x}, {y} is occupied')
-        self.put(location=location, x=x, y=y, force=False)
-        self._logger.debug('Location placed at: x=%s, y=%s', x, y)
-        check = self.violations()
+        check = self._violations_at(location, x, y)
         for violation in check:
             self._logger.debug('Found violation: %s', violation)
-        if len(check) > 0:
-            self._logger.debug(
-                'Violations found: removing location from x=%s, y=%s', x, y)
-            self.remove(x=x, y=y)
-        elif not place:
-            self._logger.debug('Removing location from x=%s, y=%s', x, y)
-            self.remove(x=x, y=y)
+        if len(check) == 0 and place:
+            self.put(location=location, x=x, y=y, force=False)
+            self._logger.debug('Location placed at: x=%s, y=%s', x, y)
         return [v.direction for v in check]
 
     def can_place(self, location: Location) -> bool:
@@ -226,7 +311,9 @@ class Board:
         for x, col in enumerate(self.grid):
             for y, cell in enumerate(col):
                 if cell is None:
-                    if self.try_place(location, x, y, place=False) == []:
+                    # Only check latitudes if longitudes are fine.
+                    if (not self._violations_at(location, x, y, Direction.LONGITUDE)
+                            and not self._violations_at(location, x, y, Direction.LATITUDE)):
                         self._logger.debug('Location %s can be placed at col x=%d, row y=%d.',
                                            location.city, x, y)
                         return True
@@ -46,27 +46,32 @@ class Player:
         """Add locations to the player's hand."""
         self._logger.debug('Player %s dealt locations: %s',
                            self.name, locations)
-        self.hand += locations
+        self.hand.extend(locations)
 
     def play(self, location: Location):
         """The player plays one of the locations in their hand, 
         which is then removed from the player's hand."""
         self._logger.debug('Player %s playing location: %s',
                            self.name, location)
-        if location not in self.hand:
+        # Look up the location once, but keep the order of the other locations in hand.
+        try:
+            index = self.hand.index(location)
+        except ValueError as e:
             raise ValueError(
-                f"Location {location} is not in %s's hand." % self.name)
-        self.hand.remove(location)
+                f"Location {location} is not in {self.name}'s hand.") from e
+        del self.hand[index]
         self.placed += 1
 
     def swap(self, loc_out: Location, loc_in: Location):
         """The player swaps location `loc_out` in their hand with new location `loc_in`."""
         self._logger.debug(
             'Player %s swapping: out %s in %s', self.name, loc_out, loc_in)
-        if loc_out not in self.hand:
+        try:
+            index = self.hand.index(loc_out)
+        except ValueError as e:
             raise ValueError(
-                f"Location {loc_out} is not in {self.name}'s hand.")
-        self.hand[self.hand.index(loc_out)] = loc_in
+                f"Location {loc_out} is not in {self.name}'s hand.") from e
+        self.hand[index] = loc_in
 
 
 class Game:
@@ -113,9 +118,11 @@ class Game:
                 self.board = Board(center=center,
                                    options=self.options.board())
                 self.players = [Player(name) for name in players]
-                # Pick initial hand of players
-                for player in self.players:
-                    player.deal(self.pick(self.options.initial()))
+                # Pick initial hands of all players at once, then split them
+                initial = self.options.initial()
+                hands = self.pick(initial * len(self.players))
+                for index, player in enumerate(self.players):
+                    player.deal(hands[index * initial:(index + 1) * initial])
             except ValueError:
                 self._logger.debug('Game initialization failed: retrying.')
             break
@@ -127,24 +134,26 @@ class Game:
     def pick(self, k=1) -> List[Location]:
         """Return a list with `k` random locations and remove them from the deck.
         If options.only_sat(), then only locations that are placeable are drawn."""
+        only_sat = self.options.only_sat()
+        if not only_sat:
+            # Every drawn location is kept, so a single draw is enough.
+            try:
+                return self.deck.pick(k)
+            except ValueError as e:
+                self._logger.critical(
+                    'It seems `pick` has been called in a gameover state.')
+                raise e
         to_draw = k
         result = []
         while to_draw > 0:
             try:
                 locs = self.deck.pick(to_draw)
             except ValueError as e:
-                if self.options.only_sat():
-                    self._logger.debug(
-                        'Out of placeable cities: forcing gameover.')
-                else:
-                    self._logger.critical(
-                        'It seems `pick` has been called in a gameover state.')
+                self._logger.debug(
+                    'Out of placeable cities: forcing gameover.')
                 raise e
             assert len(locs) == to_draw
-            if self.options.only_sat():
-                placeable = [l for l in locs if self.board.can_place(l)]
-            else:
-                placeable = locs
+            placeable = [l for l in locs if self.board.can_place(l)]
             result += placeable
             to_draw -= len(placeable)
         if len(result) != k:
@@ -157,7 +166,7 @@ class Game:
 
     def swap(self, player: Player, location: Location):
         """The current player swaps one of the cards in their hand."""
-        if player not in self.players or self.players.index(player) != self.turn:
+        if player is not self.current_player():
             raise ValueError("Player {player} cannot play now")
         if not self.options.may_swap():
             raise ValueError("Swapping is now allowed")
@@ -178,7 +187,7 @@ class Game:
         """The current player tries to place on the board one of the
         locations in their hand. Return list of offending directions,
         or the empty list if placement was successful."""
-        if player not in self.players or self.players.index(player) != self.turn:
+        if player is not self.current_player():
             raise ValueError(f'Player {player} cannot play now')
         self._logger.debug(
             'Player %s plays %s at x=%s, y=%s', player.name, location, x, y)
@@ -215,6 +224,4 @@ class Game:
     def results(self) -> list[Player]:
         """List of players from top scorer (i.e., the one with the
         fewest cities in hand)."""
-        players = sorted([(p, p.score(), p.placed_locations()) for p in self.players],
-                         key=lambda e: (e[1], -e[2]))
-        return [player for player, score, placed in players]
+        return sorted(self.players, key=lambda p: (p.score(), -p.placed_locations()))
@@ -1,14 +1,16 @@
 """This module provides classes for locations, lists of locations, and geographical coordinates."""
 
-from typing import Set, List, Optional
+from typing import Set, List, Optional, Tuple
 import logging
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
-from collections import UserList
+from operator import itemgetter
 import os
 import csv
 import re
 import random
+import sys
 
 from .constants import ENV_LANGUAGE, CONTINENTS_PATH, CITIES_PATH
 
@@ -56,8 +58,15 @@ if os.environ[ENV_LANGUAGE] == 'EN':
 elif os.environ[ENV_LANGUAGE] == 'IT':
     Continent = ContinentIT
 
+# Parenthesized parts of country names, which are dropped when loading locations.
+_COUNTRY_PARENS = re.compile(r'[(].*[)]')
 
-@dataclass(unsafe_hash=True)
+# Columns of CITIES_PATH used to build locations, in the order they are read.
+_CITIES_COLUMNS = ('city', 'city_ascii', 'lat', 'lng', 'country',
+                   'iso2', 'iso3', 'capital', 'population', 'id')
+
+
+@dataclass(unsafe_hash=True, slots=True)
 class Location:  # pylint: disable=too-many-instance-attributes  # Ignore this rule for dataclasses.
     """
     Information about a location.
@@ -92,18 +101,18 @@ class Location:  # pylint: disable=too-many-instance-attributes  # Ignore this r
         """
         If `direction` is LONGITUDE: is `self.longitude` less than `other.longitude`?
         If `direction` is LATITUDE: is `self.latitude` greater than `other.latitude`?
-        Both are evaluate within `tolerance` degrees.
+        Both are evaluate within `tolerance` degrees, which must be non-negative.
         """
-        if direction == Direction.LONGITUDE:
-            return (self.longitude < other.longitude or
-                    self.longitude - other.longitude <= tolerance)
-        if direction == Direction.LATITUDE:
-            return (self.latitude > other.latitude or
-                    other.latitude - self.latitude <= tolerance)
+        # With a non-negative tolerance, a strict comparison holds only if
+        # the difference is negative, so a single comparison suffices.
+        if direction is Direction.LONGITUDE:
+            return self.longitude - other.longitude <= tolerance
+        if direction is Direction.LATITUDE:
+            return other.latitude - self.latitude <= tolerance
         raise ValueError(f'Invalid direction: {direction}')
 
 
-class Locations(UserList):
+class Locations(list):
     """A list of locations."""
 
     def __init__(self, content: Optional[List] = None, load: bool = False):
@@ -112,38 +121,57 @@ class Locations(UserList):
         if content is None:
             content = []
         if load:
-            content = self._load()
+            content = self._loaded()
         super().__init__(content)
 
+    def clone(self) -> 'Locations':
+        """Return a new list with the same locations as `self`, which
+        can be filtered and picked from without affecting `self`.
+        The locations themselves are shared, since they are never modified."""
+        return Locations(content=self)
+
     def keep(self, capitals_only: bool, continents: Set[Continent]):
         """Keep only locations that satisfy criteria."""
+        continents = frozenset(continents)
+        if not capitals_only and len(continents) == len(Continent):
+            # Every location satisfies the criteria: nothing to filter out.
+            return
         # Filter according to options
-        filtered_data = [loc for loc in self.data if (
+        self[:] = [loc for loc in self if (
             (loc.capital or not capitals_only) and
             (loc.continent in continents)
         )]
-        self.data = filtered_data
 
     def pick(self, k=1) -> List[Location]:
         """Return a list with `k` random locations and remove them from `self`.
         If there are fewer than `k` elements in `self`, raise ValueError."""
-        if k > len(self.data):
+        if k > len(self):
             raise ValueError(
-                f'Not enough locations available: {k} > {len(self.data)}')
-        indexes = random.sample(range(len(self.data)), k)
-        result = [self[k] for k in indexes]
-        # Remove in reverse order, so we don't have to recompute indexes
-        for index in sorted(indexes, reverse=True):
-            del self[index]
+                f'Not enough locations available: {k} > {len(self)}')
+        result = []
+        for _ in range(k):
+            index = random.randrange(len(self))
+            # Swap the picked location with the last one, so that removing it is O(1)
+            self[index], self[-1] = self[-1], self[index]
+            result.append(self.pop())
         return result
 
     def get(self, city: str) -> Location:
         """Return location given its city name."""
-        for location in self.data:
+        for location in self:
             if location.city == city:
                 return location
         raise ValueError(f'City {city} not found')
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _loaded() -> Tuple[Location, ...]:
+        """Return the locations in the data files, reading them only the first time.
+        There is a single cache per process: like `Continent`, which is bound
+        when this module is imported, the locations are always in the language
+        selected by ENV_LANGUAGE at that time."""
+        return tuple(Locations._load())
+
     @classmethod
     def _load(cls) -> Set:
         #pylint: disable=too-many-locals  # Manipulating CSV files requires many variables.
@@ -153,43 +181,38 @@ class Locations(UserList):
         with open(CONTINENTS_PATH, mode='r', newline='', encoding='utf-8') as filepointer:
             reader = csv.DictReader(filepointer)
             for row in reader:
-                country, continent, code = row['iso3'], row['continent'], row['code']
-                continent = [c for c in Continent if c.name == code]
-                assert len(
-                    continent) == 1, f'Continent with code {code} not found'
-                continent = continent[0]
-                country_to_continent[country] = continent
+                # Continent[code] raises KeyError if there is no continent with that code.
+                country_to_continent[row['iso3']] = Continent[row['code']]
         with open(CITIES_PATH, mode='r', newline='', encoding='utf-8') as filepointer:
-            reader = csv.DictReader(filepointer)
+            # Plain rows and column indexes avoid building a dict for every city.
+            reader = csv.reader(filepointer)
+            header = next(reader)
+            columns = itemgetter(*[header.index(column) for column in _CITIES_COLUMNS])
             for row in reader:
-                city = row['city']
-                city_ascii = row['city_ascii']
-                latitude = float(row['lat'])
-                longitude = float(row['lng'])
-                country = row['country']
-                iso2 = row['iso2']
-                iso3 = row['iso3']
-                capital = row['capital'] == 'primary'
-                try:
-                    population = int(row['population'])
-                except ValueError:
+                (city, city_ascii, latitude, longitude, country,
+                 iso2, iso3, capital, population, identifier) = columns(row)
+                latitude = float(latitude)
+                longitude = float(longitude)
+                capital = capital == 'primary'
+                # Unlike isdigit, isdecimal rejects characters such as '²' that int() rejects too.
+                if population.isdecimal():
+                    population = int(population)
+                else:
                     logger.debug(
                         'Population of: %s (%s) not found', iso3, city)
                     population = 0
-                identifier = int(row['id'])
-                try:
-                    continent = country_to_continent[iso3]
-                except KeyError:
+                identifier = int(identifier)
+                continent = country_to_continent.get(iso3)
+                if continent is None:
                     logger.debug('Continent of: %s (%s) not found', iso3, city)
-                    continent = None
-                if continent:
-                    country = re.sub(r'[(].*[)]', '', country).strip()
-                    location = Location(city=city, city_ascii=city_ascii,
-                                        longitude=longitude, latitude=latitude,
-                                        country=country, population=population,
-                                        identifier=identifier,
-                                        country_iso2=iso2,
-                                        country_iso3=iso3,
-                                        continent=continent, capital=capital)
-                    locations.append(location)
+                    continue
+                # Country names and codes repeat across cities: share one string object each.
+                country = sys.intern(_COUNTRY_PARENS.sub('', country).strip())
+                iso2 = sys.intern(iso2)
+                iso3 = sys.intern(iso3)
+                # Positional arguments, in field order, are much cheaper than keywords.
+                location = Location(city, city_ascii, longitude, latitude,
+                                    country, iso2, iso3, population,
+                                    identifier, continent, capital)
+                locations.append(location)
         return set(locations)
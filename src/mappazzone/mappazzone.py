@@ -1,5 +1,7 @@
 """This module provides entry points to run the game."""
 
+from typing import TYPE_CHECKING
+from functools import lru_cache
 import sys
 import os
 import logging
@@ -7,11 +9,12 @@ import logging.handlers
 import locale
 from pathlib import Path
 import argparse
-import platformdirs
-import tkinter as tk
 
 from .constants import LANGUAGES, ENV_LANGUAGE, APP_NAME
 
+if TYPE_CHECKING:
+    import tkinter as tk
+
 
 def handle_exception(exc_type, exc_value, exc_traceback):
     """Log uncaught exceptions."""
@@ -23,34 +26,56 @@ def handle_exception(exc_type, exc_value, exc_traceback):
                                 exc_info=(exc_type, exc_value, exc_traceback))
 
 
+class _RunRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating log handler that rolls over only when explicitly
+    requested, at the start of a run, and never while emitting records."""
+
+    def shouldRollover(self, record) -> bool:
+        # Without this override, every record checks the log file on disk.
+        return False
+
+
+@lru_cache(maxsize=1)
+def _default_log_dir() -> Path:
+    """The current user's log directory for the application."""
+    # pylint: disable=import-outside-toplevel
+    # Only needed for the default log directory; not importing it speeds up startup.
+    import platformdirs
+    return Path(platformdirs.user_log_dir(APP_NAME))
+
+
 def log_setup(nolog=False, logdir=None):
     """Set up logger for the whole application."""
+    sys.excepthook = handle_exception
+    if nolog:
+        # No log file is written, so there is nothing else to set up.
+        logging.disable()
+        return
     if logdir is None:
-        log_dir = Path(platformdirs.user_log_dir(APP_NAME))
+        log_dir = _default_log_dir()
     else:
         log_dir = Path(logdir)
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = Path(log_dir, f'{APP_NAME}.log')
-    if nolog:
-        logging.disable()
-    else:
-        logging.basicConfig(level=logging.DEBUG)
+    logging.basicConfig(level=logging.DEBUG)
     # Remove deafult handler, introduced by basicConfig, so that it
     # does not log to terminal but only to file as defined below.
     logging.getLogger('').handlers.clear()
+    # Each run starts a new log file, unless the previous run logged nothing.
+    rollover = log_file.exists() and log_file.stat().st_size > 0
     # Log handler that writes messages to rotating log files.
-    handler = logging.handlers.RotatingFileHandler(log_file, backupCount=5)
+    handler = _RunRotatingFileHandler(log_file, backupCount=5)
     handler.setLevel(logging.DEBUG)
     # Create message formatter.
     formatter = logging.Formatter(
         '%(asctime)s %(name)-12s %(funcName)-25s %(lineno)d %(levelname)-8s MESSAGE: %(message)s')
     handler.setFormatter(formatter)
     logging.getLogger('').addHandler(handler)
-    logging.handlers.RotatingFileHandler.doRollover(handler)
-    sys.excepthook = handle_exception
+    if rollover:
+        handler.doRollover()
 
 
-def run(language, nolog, logdir, startloop=True) -> tk.Tk:
+def run(language, nolog, logdir, startloop=True) -> 'tk.Tk':
     """
     Run the application and return it.
 
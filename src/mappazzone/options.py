@@ -1,7 +1,7 @@
 """This module provides support for game options in multiple languages."""
 
-from dataclasses import dataclass
-from typing import Any, List, Set
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Set
 import os
 
 from .constants import ENV_LANGUAGE
@@ -28,14 +28,21 @@ class Option:
     # Used to store UI components associated with an option.
     _var: Any = None
 
+    # Map each choice's string representation to the choice.
+    _choices_by_str: Dict[str, Any] = field(
+        init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._choices_by_str = {str(choice): choice for choice in self.choices}
+
     def set(self, value: Any):
         """Set option to `value`. If `value` is a string that is not
-        one of the available `choices`, try to convert the string
-        based on the type of `choices`'s first element."""
+        one of the available `choices`, set the option to the choice
+        whose string representation is `value`."""
         if value in self.choices:
             self.value = value
-        elif isinstance(value, str) and self.choices and value in [str(o) for o in self.choices]:
-            self.value = type(self.choices[0])(value)
+        elif isinstance(value, str) and value in self._choices_by_str:
+            self.value = self._choices_by_str[value]
         else:
             raise ValueError(
                 f"{value} is not a valid choice for option {self.name}")
@@ -78,16 +85,8 @@ class EmptyOptions:
 
     def continents(self) -> Set[Continent]:
         """Use only locations in these continents."""
-        result = [c for c in list(Continent) if (
-            (c == Continent.EU and self[Continent.EU.name]) or
-            (c == Continent.AS and self[Continent.AS.name]) or
-            (c == Continent.AF and self[Continent.AF.name]) or
-            (c == Continent.NA and self[Continent.NA.name]) or
-            (c == Continent.SA and self[Continent.SA.name]) or
-            (c == Continent.OC and self[Continent.OC.name]) or
-            (c == Continent.AN and self[Continent.AN.name])
-        )]
-        return set(result)
+        # Each continent's option is tagged with the continent's name.
+        return {c for c in Continent if self[c.name]}
 
     def capitals_only(self) -> bool:
         """Use only capital cities?"""
@@ -121,8 +120,9 @@ class EmptyOptions:
             draw = self['draw when fail'] * mistakes
         else:
             draw = self['draw when fail']
-        if hand + draw > self['stop drawing']:
-            return self['stop drawing'] - hand
+        stop_drawing = self['stop drawing']
+        if hand + draw > stop_drawing:
+            return stop_drawing - hand
         return draw
 
     def gameover(self, rounds: int, scores: List[int], placed: int, deck: int) -> str:
@@ -133,10 +133,11 @@ class EmptyOptions:
         in Messages, or the empty string if the game is not over."""
         if 0 < self['end rounds'] < rounds:
             return 'game over rounds'
+        end_hand = self['end hand']
         for score in scores:
             if score == 0:
                 return 'game over score'
-            if score >= self['end hand']:
+            if score >= end_hand:
                 return 'game over hand'
         if 0 < self['end placed'] <= placed:
             return 'game over placed'
@@ -153,14 +154,14 @@ class EmptyOptions:
         return ", ".join(options)
 
     def __init__(self):
-        try:
-            for option, optdesc in self._DESCRIPTIONS.items():
-                if optdesc.name:
-                    self._OPTIONS[option].name = optdesc.name
-                if optdesc.description:
-                    self._OPTIONS[option].description = optdesc.description
-        except AttributeError:
-            pass
+        # Copy the class's default options, so that instances do not share option values.
+        # pylint: disable=invalid-name  # The instance attribute shadows the class's _OPTIONS.
+        self._OPTIONS = {option: replace(opt) for option, opt in self._OPTIONS.items()}
+        for option, optdesc in getattr(self, '_DESCRIPTIONS', {}).items():
+            if optdesc.name:
+                self._OPTIONS[option].name = optdesc.name
+            if optdesc.description:
+                self._OPTIONS[option].description = optdesc.description
 
     _OPTIONS = {
         'grid size': Option(
@@ -2,6 +2,7 @@
 
 import os
 import logging
+import textwrap
 
 from .constants import ENV_LANGUAGE
 
@@ -13,16 +14,21 @@ class EmptyMessages:  # pylint: disable=too-few-public-methods
         return self._MESSAGES[message_name]
 
     def __init__(self):
+        cls = type(self)
+        # If there exist an attribute _TRANSLATIONS, use it to build the
+        # class's own _MESSAGES, the first time the class is instantiated.
+        # Merging when instantiating, rather than when importing, logs any
+        # errors after the application has set up logging.
+        if '_MESSAGES' in vars(cls):
+            return
         logger = logging.getLogger(__name__)
-        # If there exist an attribute _TRANSLATIONS, use it to update _MESSAGES.
-        try:
-            for key, message in self._TRANSLATIONS.items():
-                if key in self._MESSAGES:
-                    self._MESSAGES[key] = message
-                else:
-                    logger.error("Message '%s' not found.", key)
-        except AttributeError:
-            pass
+        messages = dict(cls._MESSAGES)
+        for key, message in getattr(cls, '_TRANSLATIONS', {}).items():
+            if key in messages:
+                messages[key] = message
+            else:
+                logger.error("Message '%s' not found.", key)
+        cls._MESSAGES = messages
 
     _MESSAGES = {
         'app name': '',
@@ -79,7 +85,7 @@ class MessagesEN(EmptyMessages):  # pylint: disable=too-few-public-methods
             'The game is over after a maximum number of locations have been placed on the board.'
         ),
         'game over deck': 'The game is over because the deck is empty.',
-        'how to play': """
+        'how to play': textwrap.dedent("""
         Mappazzone is a geolocalization board game.
 
         At the beginning of a game, a location is drawn from the deck
@@ -132,7 +138,7 @@ class MessagesEN(EmptyMessages):  # pylint: disable=too-few-public-methods
         (longitude 138 E) to the west (left) of a location in Hawaii
         (longitude -155 W), even though you can reach Japan from
         Hawaii traveling west.
-        """,
+        """),
     }
 
 
@@ -168,7 +174,7 @@ class MessagesIT(EmptyMessages):  # pylint: disable=too-few-public-methods
             'sono state piazzate sul tavolo di gioco.'
         ),
         'game over deck': 'La partita è finita perché il mazzo è esaurito.',
-        'how to play': """
+        'how to play': textwrap.dedent("""
         Mappazzone è un gioco di geolocalizzazione.
 
         All'inizio di una partita, una città viene pescata dal mazzo e
@@ -224,7 +230,7 @@ class MessagesIT(EmptyMessages):  # pylint: disable=too-few-public-methods
         138 E) a ovest (sinistra) di una città nelle Hawaii
         (longitudine -155 O), anche se in realtà si può raggiungere il
         Giappone viaggiando dalle Hawaii in direzione ovest.
-        """,
+        """),
     }
 
 
@@ -1,8 +1,7 @@
 """This module contains the classes that define the graphical user interface of the game."""
 
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 import logging
-import copy
 import os
 import textwrap
 import tkinter as tk
@@ -33,8 +32,14 @@ class MappUI(tk.Tk):
         game: The game state.
         messages: The messages for the current language.
         logger: The logger for this class.
+        flag_images: The flag images already loaded, by country code and size.
+        flag_sources: The flag images already decoded at their original size, by country code.
+        fonts: The fonts already created, by size.
+        blank_image: A 1x1 blank image, used to size buttons in pixels.
     """
 
+    # pylint: disable=too-many-instance-attributes  # Encapsulating the attributes in dataclasses doesn't seem necessary.
+
     _frame: Optional[tk.Frame]
 
     options: Options
@@ -45,6 +50,11 @@ class MappUI(tk.Tk):
     messages: Messages
     logger: logging.Logger
 
+    flag_images: Dict[Tuple[str, int, int], ImageTk.PhotoImage]
+    flag_sources: Dict[str, Image.Image]
+    fonts: Dict[int, tkfont.Font]
+    blank_image: tk.PhotoImage
+
     def __init__(self, options: Options, locations: Locations):
         tk.Tk.__init__(self)
         self.log_setup()
@@ -52,6 +62,10 @@ class MappUI(tk.Tk):
         self.options = options
         self.locations = locations
         self.player_names = []
+        self.flag_images = {}
+        self.flag_sources = {}
+        self.fonts = {}
+        self.blank_image = tk.PhotoImage(width=1, height=1)
         self.title(self.messages['app name'])
         self._frame = None
         self.configure(bg='')
@@ -62,6 +76,12 @@ class MappUI(tk.Tk):
         """Set up logger for this class."""
         self.logger = logging.getLogger(__name__)
 
+    def font(self, size: int) -> tkfont.Font:
+        """Font of the given `size`, created only the first time it is requested."""
+        if size not in self.fonts:
+            self.fonts[size] = tkfont.Font(size=size)
+        return self.fonts[size]
+
     def switch_frame(self, frame_class):
         """Destroy current frame and replace it with a new one."""
         new_frame = frame_class(self)
@@ -97,9 +117,7 @@ class StartMenu(tk.Frame):
         rules_window.title(self.main.messages['app name']
                            + ': '
                            + self.main.messages['show rules'])
-        rules_text = self.main.messages['how to play'].split('\n')
-        rules_text = '\n'.join([line.strip() for line in rules_text])
-        rules = tk.Label(rules_window, text=rules_text,
+        rules = tk.Label(rules_window, text=self.main.messages['how to play'],
                          wraplength=0, anchor='w', justify=tk.LEFT)
         rules.pack()
 
@@ -128,7 +146,7 @@ class StartMenu(tk.Frame):
             return
         self.main.player_names = player_names
         # Copy locations so that the current filtering options can be applied
-        locations = copy.deepcopy(self.main.locations)
+        locations = self.main.locations.clone()
         self.main.game = Game(options=self.main.options,
                               players=self.main.player_names,
                               locations=locations)
@@ -211,13 +229,18 @@ class GameUI(tk.Frame):
         game: The game state.
         size: The size of the board (equal to game.board.opts.size).
         board_frame: The frame displaying the board.
+        cells: The buttons displaying the board's cells, by coordinates.
         hand_frame: The frame displaying the current player's hand.
         tile_len: The size of the square tiles in the board (in pixels).
+        remaining_width: The width of the screen not taken by the board (in pixels).
+        coord_fontsize: The font size of the coordinates in the board's tiles.
+        direction_fontsize: The font size of the directions in the board's tiles.
         location_width: The width of the location frames in the player's hand (in pixels).
         location_height: The height of the location frames in the player's hand (in pixels).
         selected: The index, among the list in the current player's hand, 
                   of the currently selected location.
         location_frames: A list of frames displaying the locations in the current player's hand.
+        _pending_turn: The identifier of the scheduled move to the next turn, if any.
         """
 
     # pylint: disable=too-many-instance-attributes  # Encapsulating the attributes in dataclasses doesn't seem necessary.
@@ -228,14 +251,20 @@ class GameUI(tk.Frame):
     size: int
 
     board_frame: tk.Frame
+    cells: Dict[Tuple[int, int], tk.Button]
     hand_frame: tk.Frame
     tile_len: int
+    remaining_width: int
+    coord_fontsize: int
+    direction_fontsize: int
     location_width: int
     location_height: int
 
     selected: Optional[int]
     location_frames: List[tk.Frame]
 
+    _pending_turn: Optional[str]
+
     def __init__(self, main):
         tk.Frame.__init__(self, main)
         self.main = main
@@ -243,15 +272,24 @@ class GameUI(tk.Frame):
         self.size = self.game.board.opts.size
         self.location_frames = []
         self.selected = None
+        self._pending_turn = None
         # Maximize window
         # if platform.system() == 'Windows':
         #     self.main.state('zoomed')
         # else:
         #     self.main.attributes('-zoomed', True)
         self.set_sizes()
-        # Every time GameUI is reloaded it's a new turn.
+        # The board is drawn once: later turns only redraw what changed (see `next_turn`).
+        self.draw_board()
         self.turn()
 
+    def destroy(self):
+        """Cancel the scheduled move to the next turn, if any, and destroy the frame."""
+        if self._pending_turn is not None:
+            self.after_cancel(self._pending_turn)
+            self._pending_turn = None
+        tk.Frame.destroy(self)
+
     def set_sizes(self) -> int:
         """Determine a suitable size, in pixels, of the board's tiles,
         so that the whole board fits in about half of the current monitor."""
@@ -263,6 +301,9 @@ class GameUI(tk.Frame):
                 self.tile_len = tile_len
                 break
             frac += 0.1
+        # Font sizes that only depend on the tile size.
+        self.coord_fontsize = DisplayName('-00', 0.35 * self.tile_len).fontsize()
+        self.direction_fontsize = DisplayName('W', 1/5 * self.tile_len).fontsize()
         remaining_width = int(monitor_width - (20 + self.size * tile_len))
         self.remaining_width = remaining_width
         frac = 1.0
@@ -285,18 +326,30 @@ class GameUI(tk.Frame):
     def turn(self):
         """Check if the game is over or whether the current turn should be played."""
         self.main.logger.debug('Reload board.')
-        self.main.logger.debug(str(self.game.board))
-        self.draw_board()
-        if self.game.gameover():
+        self.main.logger.debug('%s', self.game.board)
+        gameover = self.game.gameover()
+        if gameover:
             self.main.logger.debug('Game over: show results.')
-            self.draw_results()
+            self.draw_results(gameover)
         else:
             self.main.logger.debug('Next turn.')
             self.draw_player()
 
+    def next_turn(self, changed: Optional[Tuple[int, int]] = None):
+        """Move on to the next turn, redrawing only the hand and, if
+        `changed` is not None, the board cell at coordinates `changed`."""
+        self._pending_turn = None
+        if changed is not None:
+            self.draw_cell(*changed)
+        self.hand_frame.destroy()
+        self.location_frames = []
+        self.selected = None
+        self.turn()
+
     def set_selected(self, selected: Optional[int]):
         """Set the index of the location, among those in the current
         player's hand, that has last been clicked."""
+        previous = self.selected
         if selected == self.selected:
             # Selecting the same location means unselecting it
             self.selected = None
@@ -304,18 +357,20 @@ class GameUI(tk.Frame):
         else:
             self.selected = selected
             self.main.logger.debug('Location %d selected.', self.selected)
-        for k, location_frame in enumerate(self.location_frames):
-            if k == self.selected:
-                # Highlight the selected location
-                location_frame.config(highlightbackground='red')
-            else:
-                # Unhighlight all the other locations
-                location_frame.config(highlightbackground='white')
+        # Only the previously and newly selected locations change highlight
+        if previous is not None and previous < len(self.location_frames):
+            self.location_frames[previous].config(highlightbackground='white')
+        if self.selected is not None and self.selected < len(self.location_frames):
+            self.location_frames[self.selected].config(highlightbackground='red')
 
     def place_selected(self, x: int, y: int):
         """Try to place the selected location on the board at
         coordinates `x`, `y`."""
         # pylint: disable=invalid-name  # x and y are valid names for coordinate variables.
+        if self._pending_turn is not None:
+            # The displayed hand belongs to the player who has just played.
+            self.main.logger.debug('Waiting for the next turn: cannot place.')
+            return
         try:
             player = self.game.current_player()
             location = player.hand[self.selected]
@@ -347,34 +402,37 @@ class GameUI(tk.Frame):
                                                    highlight=[Direction.LONGITUDE,
                                                               Direction.LATITUDE],
                                                    highlightcol='green')
-        placed_button.grid(row=y, column=x)
-        # Wait, and then reload GameUI
-        self.after(self.game.options.turn_delay() * 1000,
-                   lambda: self.main.switch_frame(GameUI))
+        self.set_cell(x, y, placed_button)
+        # Wait, and then move on to the next turn
+        self._pending_turn = self.after(self.game.options.turn_delay() * 1000,
+                                        lambda: self.next_turn(changed=(x, y)))
 
     def swap_selected(self, selected: int):
         """Swap the selected location."""
+        if self._pending_turn is not None:
+            self.main.logger.debug('Waiting for the next turn: cannot swap.')
+            return
         # Double click also selects the location.
         self.set_selected(selected)
         player = self.game.current_player()
         location = player.hand[selected]
         # Swap
         self.game.swap(player, location)
-        # Reload GameUI
-        self.main.switch_frame(GameUI)
+        # The board is unchanged: move on to the next turn
+        self.next_turn()
 
-    def draw_results(self):
-        """Display the information about who won the game."""
+    def draw_results(self, gameover: str):
+        """Display the information about who won the game, which is
+        over for reason `gameover` (a message name, as returned by `Game.gameover`)."""
         self.hand_frame = tk.Frame(self, pady=30)
         self.hand_frame.pack()
-        gameover = self.main.game.gameover()
         gameover_reason = self.main.messages[gameover]
         gameover_label = tk.Label(self.hand_frame,
                                   text=textwrap.fill(gameover_reason, 40),
-                                  font=tkfont.Font(size=16))
+                                  font=self.main.font(16))
         gameover_label.grid(row=0, column=0, columnspan=2, pady=20, padx=20)
         results = self.main.game.results()
-        longest_name = sorted([p.name for p in results], key=len)[-1]
+        longest_name = max((p.name for p in results), key=len)
         name_label = DisplayName(longest_name, int(0.5 * self.remaining_width),
                                  padx=0, truncate=False)
         fontsize = min(24, name_label.fontsize())
@@ -383,11 +441,11 @@ class GameUI(tk.Frame):
             name = player.name
             n_label = tk.Label(self.hand_frame,
                                text=f'{n_player + 1}:',
-                               font=tkfont.Font(size=fontsize))
+                               font=self.main.font(fontsize))
             n_label.grid(row=n_player + 1, column=0, padx=5, sticky='E')
             name_label = tk.Label(self.hand_frame,
                                   text=name,
-                                  font=tkfont.Font(size=fontsize))
+                                  font=self.main.font(fontsize))
             name_label.grid(row=n_player + 1, column=1, padx=5, sticky='W')
         back_button = tk.Button(self.hand_frame,
                                 text=self.main.messages['back to main'],
@@ -406,7 +464,7 @@ class GameUI(tk.Frame):
                               self.remaining_width, truncate=False)
         player_label = tk.Label(self.hand_frame,
                                 text=str(to_play),
-                                font=tkfont.Font(size=min(35, to_play.fontsize())))
+                                font=self.main.font(min(35, to_play.fontsize())))
         player_label.grid(row=0, column=0, columnspan=2, pady=7)
         instructions = self.main.messages['place instructions']
         instructions += ('\n' + self.main.messages['swap instructions']) \
@@ -415,7 +473,7 @@ class GameUI(tk.Frame):
                                    self.remaining_width, padx=0, truncate=False)
         instructions_label = tk.Label(self.hand_frame,
                                       text=str(instructions),
-                                      font=tkfont.Font(size=instructions.fontsize()))
+                                      font=self.main.font(instructions.fontsize()))
         instructions_label.grid(row=1, column=0, columnspan=2, pady=5)
         for k, location in enumerate(player.hand):
             row, col = k // 2, k % 2
@@ -431,14 +489,29 @@ class GameUI(tk.Frame):
         """Display the information about the current board."""
         self.board_frame = tk.Frame(self, padx=10)
         self.board_frame.pack(side='left', anchor='center')
+        self.cells = {}
         # pylint: disable=invalid-name  # x and y are valid names for coordinate variables.
         for x in range(self.size):
             for y in range(self.size):
-                location_frame = self.location_on_board(
-                    self.game.board.get(x, y))
-                location_frame.grid(row=y, column=x)
-                location_frame.bind("<Button-1>",
-                                    lambda e, x=x, y=y: self.place_selected(x, y))
+                self.draw_cell(x, y)
+
+    def draw_cell(self, x: int, y: int):
+        """Display the board's cell at coordinates `x`, `y`, so that
+        clicking on it places the selected location there."""
+        # pylint: disable=invalid-name  # x and y are valid names for coordinate variables.
+        location_frame = self.location_on_board(self.game.board.get(x, y))
+        location_frame.bind("<Button-1>",
+                            lambda e, x=x, y=y: self.place_selected(x, y))
+        self.set_cell(x, y, location_frame)
+
+    def set_cell(self, x: int, y: int, button: tk.Button):
+        """Display `button` in the board's cell at coordinates `x`, `y`,
+        replacing the button currently displayed there."""
+        # pylint: disable=invalid-name  # x and y are valid names for coordinate variables.
+        if (x, y) in self.cells:
+            self.cells[(x, y)].destroy()
+        self.cells[(x, y)] = button
+        button.grid(row=y, column=x)
 
     def location_on_board(self, location: Optional[Location],
                           highlight: Optional[List[Direction]] = None,
@@ -453,9 +526,8 @@ class GameUI(tk.Frame):
         # Add blank image to button, so that width and height can
         # be specified in pixels
         tile_len = self.tile_len
-        blank = tk.PhotoImage(width=1, height=1)
         location_frame = tk.Button(self.board_frame,
-                                   image=blank,
+                                   image=self.main.blank_image,
                                    compound='c',
                                    width=tile_len, height=tile_len)
         location_frame.grid_columnconfigure(0, weight=1, uniform='fred')
@@ -466,18 +538,17 @@ class GameUI(tk.Frame):
         if location is not None:
             location_name = DisplayName(location.city, tile_len)
             location_label = tk.Label(location_frame, text=location_name,
-                                      font=tkfont.Font(size=min(38, location_name.fontsize())))
+                                      font=self.main.font(min(38, location_name.fontsize())))
             Hovertip(location_label, location_name.name)
             location_label.grid(row=0, column=0, columnspan=2)
             country_name = DisplayName(location.country, 3/4 * tile_len)
             country_label = tk.Label(location_frame, text=country_name,
-                                     font=tkfont.Font(size=country_name.fontsize()))
+                                     font=self.main.font(country_name.fontsize()))
             Hovertip(country_label, country_name.name)
             country_label.grid(row=1, column=0, columnspan=2)
             longitude = int(round(location.longitude))
-            coord_fontsize = DisplayName('-00', 0.35 * tile_len).fontsize()
             longitude_label = tk.Label(location_frame, text=longitude,
-                                       font=tkfont.Font(size=coord_fontsize))
+                                       font=self.main.font(self.coord_fontsize))
             if Direction.LONGITUDE in highlight:
                 longitude_label.config(fg=highlightcol)
             longitude_label.grid(row=2, column=0)
@@ -487,13 +558,12 @@ class GameUI(tk.Frame):
                 direction = self.main.messages['direction west']
             else:
                 direction = self.main.messages['direction null']
-            direction_fontsize = DisplayName('W', 1/5*tile_len).fontsize()
             longitude_direction = tk.Label(location_frame, text=direction,
-                                           font=tkfont.Font(size=direction_fontsize))
+                                           font=self.main.font(self.direction_fontsize))
             longitude_direction.grid(row=3, column=0, pady=0)
             latitude = int(round(location.latitude))
             latitude_label = tk.Label(location_frame, text=latitude,
-                                      font=tkfont.Font(size=coord_fontsize))
+                                      font=self.main.font(self.coord_fontsize))
             if Direction.LATITUDE in highlight:
                 latitude_label.config(fg=highlightcol)
             latitude_label.grid(row=2, column=1, pady=0)
@@ -504,7 +574,7 @@ class GameUI(tk.Frame):
             else:
                 direction = self.main.messages['direction null']
             latitude_direction = tk.Label(location_frame, text=direction,
-                                          font=tkfont.Font(size=direction_fontsize))
+                                          font=self.main.font(self.direction_fontsize))
             latitude_direction.grid(row=3, column=1, pady=0)
         return location_frame
 
@@ -525,7 +595,7 @@ class GameUI(tk.Frame):
         # Location name
         location_name = DisplayName(location.city, int(0.7 * cell_width))
         location_label = tk.Label(location_frame, text=location_name,
-                                  font=tkfont.Font(size=location_name.fontsize()))
+                                  font=self.main.font(location_name.fontsize()))
         Hovertip(location_label, location_name.name)
         location_label.grid(row=0, column=0, columnspan=2)
         # Flag and Country, Continent
@@ -544,26 +614,40 @@ class GameUI(tk.Frame):
         # Country, Continent
         country_name = DisplayName(location.country, int(0.5 * cell_width))
         country_label = tk.Label(location_frame, text=country_name,
-                                 font=tkfont.Font(size=country_name.fontsize()))
+                                 font=self.main.font(country_name.fontsize()))
         Hovertip(country_label, country_name.name)
         country_label.grid(row=1, column=1, padx=20)
         continent_name = DisplayName(location.continent.value,
                                      int(0.4 * cell_width))
         continent_label = tk.Label(location_frame, text=continent_name,
-                                   font=tkfont.Font(size=min(continent_name.fontsize(),
-                                                             country_name.fontsize())))
+                                   font=self.main.font(min(continent_name.fontsize(),
+                                                           country_name.fontsize())))
         Hovertip(continent_label, continent_name.name)
         continent_label.grid(row=2, column=1, padx=20)
         return location_frame
 
     def get_flag_image(self, iso3: str, size: Tuple[int, int]) -> ImageTk.PhotoImage:
-        """Load flag image for country with code `iso3`, and resize it to `size`."""
-        path = os.path.join(FLAGS_DIR, f'{iso3.upper()}.png')
-        if not os.path.exists(path):
+        """Load flag image for country with code `iso3`, and resize it to `size`.
+        Each flag is decoded only once, and resized only once for each size."""
+        iso3 = iso3.upper()
+        key = (iso3, size[0], size[1])
+        if key in self.main.flag_images:
+            return self.main.flag_images[key]
+        path = os.path.join(FLAGS_DIR, f'{iso3}.png')
+        if iso3 in self.main.flag_sources:
+            image = self.main.flag_sources[iso3]
+        elif os.path.exists(path):
+            image = Image.open(path)
+            image.load()
+            self.main.flag_sources[iso3] = image
+        else:
+            image = None
+        if image is None:
             self.main.logger.debug(
                 "Couldn't find a flag for country %s.", iso3)
-            return tk.PhotoImage(width=size[0], height=size[1])
-        image = Image.open(path)
-        # pylint: disable=no-member  # Image.LANCZOS is a valid attribute.
-        image = image.resize(size, Image.LANCZOS)
-        return ImageTk.PhotoImage(image)
+            flag_image = tk.PhotoImage(width=size[0], height=size[1])
+        else:
+            # pylint: disable=no-member  # Image.LANCZOS is a valid attribute.
+            flag_image = ImageTk.PhotoImage(image.resize(size, Image.LANCZOS))
+        self.main.flag_images[key] = flag_image
+        return flag_image
@@ -1,6 +1,7 @@
 """This module provides utility functions for UI formatting and image generation."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
 import sys
 import os
@@ -34,11 +35,11 @@ def export_flags(outdir: str):
                 continue
         outfname = os.path.join(outdir, code + '.png')
         flag = flagpy.get_flag_img(country)
-        flag.save(outfname)
+        flag.save(outfname, optimize=True)
     # Also create "blank" flag
     flag = Image.new('RGB', (300, 200), 'white')
     outfname = os.path.join(outdir, '_blank_' + '.png')
-    flag.save(outfname)
+    flag.save(outfname, optimize=True)
 
 
 def monitor_size(main: tk.Tk) -> Tuple[int, int]:
@@ -55,6 +56,31 @@ def monitor_size(main: tk.Tk) -> Tuple[int, int]:
     return (main.winfo_screenwidth(), main.winfo_screenheight())
 
 
+@lru_cache(maxsize=4096)
+def _fit_fontsize(text: str, max_width: float) -> int:
+    """Largest font size that fits `text` within `max_width` pixels.
+    Results are cached, since the UI measures the same strings at every redraw."""
+    font = tkfont.Font(size=1)
+
+    def fits(fontsize: int) -> bool:
+        font.configure(size=fontsize)
+        # Width of string in pixels
+        return font.measure(text) <= max_width
+
+    # The width grows with the font size: find a size that does not fit
+    # by doubling, and then bisect between the last size that fits and it.
+    low, high = 0, 1
+    while fits(high):
+        low, high = high, 2 * high
+    while high - low > 1:
+        mid = (low + high) // 2
+        if fits(mid):
+            low = mid
+        else:
+            high = mid
+    return low
+
+
 @dataclass
 class DisplayName:
     """
@@ -76,16 +102,7 @@ class DisplayName:
 
     def fontsize(self) -> int:
         """Font size that fits the (truncated) string within the maximum width."""
-        fontsize = 0
-        while True:
-            fontsize += 1
-            font = tkfont.Font(size=fontsize)
-            # Width of string in pixels
-            width = font.measure(self.padx * ' ' + str(self))
-            # Height of string in pixels
-            # height = font.measure('linespace')
-            if width > self.max_width:
-                return fontsize - 1
+        return _fit_fontsize(self.padx * ' ' + str(self), self.max_width)
 
     def __str__(self) -> str:
         name = self.name
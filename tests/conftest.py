@@ -0,0 +1,5 @@
+import sys
+import os
+
+# Make package `mappazzone` importable from the source tree, for all tests
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'src'))
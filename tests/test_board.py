@@ -1,7 +1,7 @@
-import sys
 import os
+import copy
+import random
 import pytest
-sys.path.append(os.path.dirname(os.path.realpath(__file__)) + '/../src')
 
 from mappazzone.constants import ENV_LANGUAGE
 os.environ[ENV_LANGUAGE] = 'EN'
@@ -9,6 +9,23 @@ from mappazzone.locations import Continent, Direction, Location
 from mappazzone.board import Board
 
 
+def check_bounds(board: Board):
+    """Check that the bounds of every column and row of `board`
+    point to its earliest and latest location."""
+    for direction in Direction:
+        for m in range(board.opts.size):
+            line = board._line(direction, m)
+            locations = [loc for loc in line if loc is not None]
+            bounds = board._bounds[direction][m]
+            if not locations:
+                assert bounds is None
+                continue
+            first, last = bounds
+            for loc in locations:
+                assert line[first].before(loc, direction, 0.0)
+                assert loc.before(line[last], direction, 0.0)
+
+
 class TestBoard:
 
     def test_init(self):
@@ -138,3 +155,95 @@ class TestBoard:
         unplaceable = Location('U', '', -25, 0, 'country',
                                'iso2', 'iso3', 0, 0, Continent.EU)
         assert not board.can_place(unplaceable)
+
+    def test_try_place_unchanged(self):
+        center = Location('center', '', 0, 0, 'country', 'iso2', 'iso3', 0, 0,
+                          Continent.EU)
+        board = Board(center, Board.BoardOptions(10))
+        grid = [col[:] for col in board.grid]
+        placed = board.placed()
+        # correct placement, but not placing
+        loc = Location('L', '', -50, 50, 'country', 'iso2', 'iso3', 0, 0, Continent.EU)
+        assert board.try_place(loc, *board.coords(-1, -1, centered=True), place=False) == []
+        assert board.grid == grid and board.placed() == placed
+        # failed placement
+        assert board.try_place(loc, *board.coords(1, 1, centered=True)) == [
+            Direction.LONGITUDE, Direction.LATITUDE]
+        assert board.grid == grid and board.placed() == placed
+        check_bounds(board)
+        # occupied position
+        with pytest.raises(ValueError) as ex:
+            board.try_place(loc, board.opts.center_x, board.opts.center_y)
+        assert board.grid == grid and board.placed() == placed
+
+    def test_bounds(self):
+        center = Location('center', '', 0, 0, 'country', 'iso2', 'iso3', 0, 0,
+                          Continent.EU)
+        board = Board(center, Board.BoardOptions(10, tolerance=100))
+        # several locations in the center's column and row
+        for k, coord in enumerate([-30, 20, -10, 40]):
+            loc = Location('C', '', coord, coord, 'country', 'iso2', 'iso3', 0, 0, Continent.EU)
+            board.put(loc, *board.coords(0, k - 4, centered=True))
+            board.put(loc, *board.coords(k + 1, 0, centered=True))
+            check_bounds(board)
+        assert board.placed() == 9
+        # remove the earliest and the latest locations
+        board.remove(*board.coords(0, -4, centered=True))
+        check_bounds(board)
+        board.remove(*board.coords(4, 0, centered=True))
+        check_bounds(board)
+        assert board.placed() == 7
+        # overwrite the center
+        new_center = Location('new center', '', 90, -90, 'country', 'iso2', 'iso3', 0, 0,
+                              Continent.EU)
+        board.set_center(new_center)
+        assert board.get_center() == new_center
+        assert board.placed() == 7
+        check_bounds(board)
+        # empty column
+        board.remove(*board.coords(1, 0, centered=True))
+        assert board._bounds[Direction.LONGITUDE][board.opts.center_x + 1] is None
+        check_bounds(board)
+
+    def test_violations_same_line(self):
+        center = Location('center', '', 0, 0, 'country', 'iso2', 'iso3', 0, 0,
+                          Continent.EU)
+        board = Board(center, Board.BoardOptions(10, tolerance=2.5))
+        # same column as the center: longitudes must be equal within tolerance
+        for lng, expected in [(3, [Direction.LONGITUDE]), (-3, [Direction.LONGITUDE]),
+                              (2, []), (-2, [])]:
+            loc = Location('N', '', lng, 50, 'country', 'iso2', 'iso3', 0, 0, Continent.EU)
+            assert board.try_place(loc, *board.coords(0, -2, centered=True),
+                                   place=False) == expected
+        # same row as the center: latitudes must be equal within tolerance
+        for lat, expected in [(3, [Direction.LATITUDE]), (-3, [Direction.LATITUDE]),
+                              (2, []), (-2, [])]:
+            loc = Location('E', '', 50, lat, 'country', 'iso2', 'iso3', 0, 0, Continent.EU)
+            assert board.try_place(loc, *board.coords(2, 0, centered=True),
+                                   place=False) == expected
+
+    def test_try_place_random(self):
+        rnd = random.Random(42)
+        for tolerance in [0.0, 1.0, 2.5]:
+            center = Location('center', '', 0, 0, 'country', 'iso2', 'iso3', 0, 0,
+                              Continent.EU)
+            board = Board(center, Board.BoardOptions(6, tolerance=tolerance))
+            size = board.opts.size
+            for _ in range(500):
+                x, y = rnd.randrange(size), rnd.randrange(size)
+                if board.get(x, y) is not None:
+                    if (x, y) != (board.opts.center_x, board.opts.center_y):
+                        board.remove(x, y)
+                        check_bounds(board)
+                    continue
+                loc = Location('L', '', rnd.randint(-10, 10), rnd.randint(-10, 10),
+                               'country', 'iso2', 'iso3', 0, 0, Continent.EU)
+                result = board.try_place(loc, x, y, place=False)
+                other = copy.deepcopy(board)
+                other.put(loc, x, y)
+                assert result == [v.direction for v in other.violations()]
+                placed = board.placed()
+                assert board.try_place(loc, x, y) == result
+                assert board.placed() == placed + (not result)
+                assert not board.violations()
+                check_bounds(board)
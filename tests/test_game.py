@@ -1,7 +1,5 @@
-import sys
 import os
 import pytest
-sys.path.append(os.path.dirname(os.path.realpath(__file__)) + '/../src')
 
 from mappazzone.constants import ENV_LANGUAGE
 os.environ[ENV_LANGUAGE] = 'EN'
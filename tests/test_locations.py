@@ -1,7 +1,5 @@
-import sys
 import os
 import pytest
-sys.path.append(os.path.dirname(os.path.realpath(__file__)) + '/../src')
 
 from mappazzone.constants import ENV_LANGUAGE
 os.environ[ENV_LANGUAGE] = 'EN'
@@ -110,6 +108,14 @@ class TestLocations:
         locs.pick(3)
         assert len(locs) == len_locs - 3
 
+    def test_clone(self):
+        locs = Locations(content=self.locations())
+        clone = locs.clone()
+        assert isinstance(clone, Locations)
+        assert clone == locs
+        clone.pick(3)
+        assert len(locs) == len(clone) + 3
+
     def test_get(self):
         locs = Locations(content=self.locations())
         assert locs.get('NA')
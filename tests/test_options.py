@@ -1,7 +1,5 @@
-import sys
 import os
 import pytest
-sys.path.append(os.path.dirname(os.path.realpath(__file__)) + '/../src')
 
 from mappazzone.constants import ENV_LANGUAGE
 os.environ[ENV_LANGUAGE] = 'EN'
@@ -23,6 +21,9 @@ class TestOption:
             opt.set(False)
         with pytest.raises(ValueError) as ex:
             opt.set('7')
+        opt = Option(name='option', description='', choices=[False, True], value=True)
+        opt.set('False')
+        assert opt.value is False
 
 
 class TestOptions:
@@ -47,6 +48,8 @@ class TestOptions:
         assert opts['grid size'] == 8
         opts.set_option('grid size', '8')
         assert opts['grid size'] == 8
+        # Setting an option does not affect other instances
+        assert Options()['grid size'] == 10
 
     def test_items(self):
         opts = Options()
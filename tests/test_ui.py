@@ -3,7 +3,6 @@ import os
 import time
 import tkinter as tk
 import pytest
-sys.path.append(os.path.dirname(os.path.realpath(__file__)) + '/../src')
 
 from mappazzone.constants import ENV_LANGUAGE
 os.environ[ENV_LANGUAGE] = 'EN'
@@ -12,6 +11,26 @@ from mappazzone.themes import Messages
 from mappazzone.locations import Continent, Direction, Location
 from mappazzone.ui import GameUI
 
+# Set this environment variable to pause at each step, for visual inspection
+ENV_UI_PAUSE = 'MAPPAZZONE_UI_PAUSE'
+
+
+@pytest.fixture(scope='module', autouse=True)
+def display():
+    """The UI needs a display. On Linux without one, run the tests
+    in a virtual display through Xvfb, or skip them if it is not available."""
+    if not sys.platform.startswith('linux') or os.environ.get('DISPLAY'):
+        yield
+        return
+    xvfbwrapper = pytest.importorskip(
+        'xvfbwrapper', reason='no display, and xvfbwrapper is not installed')
+    try:
+        xvfb = xvfbwrapper.Xvfb(width=1920, height=1080)
+    except FileNotFoundError:
+        pytest.skip('no display, and Xvfb is not installed')
+    with xvfb:
+        yield
+
 
 class TestUI:
 
@@ -27,13 +46,22 @@ class TestUI:
             if isinstance(widget, tk.Button) and widget.cget('text') == text:
                 return widget
 
+    def wait_turn(self, root: tk.Tk, game: GameUI):
+        """Process events in `root` until `game` has moved on to the next turn."""
+        deadline = time.monotonic() + 5
+        while game._pending_turn is not None and time.monotonic() < deadline:
+            self.pump_events(root)
+        assert game._pending_turn is None
+
     def pause(self):
-        """Take a short pause, so that the user can visually inspect the UI state."""
-        time.sleep(3)
+        """Take a short pause, so that the user can visually inspect the UI state.
+        Pauses only if environment variable `ENV_UI_PAUSE` is set."""
+        if os.environ.get(ENV_UI_PAUSE):
+            time.sleep(3)
 
     def test_ui(self):
         """This test runs a short game through the UI by manipulating
-        its components and event loop. As the test runs, visually
+        its components and event loop. If `ENV_UI_PAUSE` is set, visually
         inspect the UI at each pause, to confirm that it runs as expected."""
         msg = Messages()
         app = run('EN', True, None, startloop=False)
@@ -41,6 +69,8 @@ class TestUI:
         main = app._frame
         # Set up only one city in hand
         app.options.set_option('initial cities', 1)
+        # Move on to the next turn without waiting
+        app.options.set_option('turn delay', 0)
         # Fill in name for player
         player_entry = main.player_entries[0]
         player_entry.insert(0, 'Player')
@@ -74,19 +104,51 @@ class TestUI:
         center_x, center_y = app.game.board.opts.center_x, app.game.board.opts.center_y
         # Place south east
         game.place_selected(x=center_x + 1, y=center_y + 1)
+        highlighted = game.cells[(center_x + 1, center_y + 1)]
+        # Mistakes were made
+        drawn = app.options.to_draw([Direction.LONGITUDE, Direction.LATITUDE], 1)
+        assert len(player.hand) == drawn
+        # No more moves until the next turn, even with a location selected
+        assert game.selected == 0
+        game.place_selected(x=center_x - 1, y=center_y - 1)
+        assert len(player.hand) == drawn
+        assert app.game.board.get(center_x - 1, center_y - 1) is None
+        hand = list(player.hand)
+        game.swap_selected(0)
+        assert player.hand == hand
         self.pump_events(app)
         self.pause()
-        # Mistakes were made
-        assert len(player.hand) == app.options.to_draw([Direction.LONGITUDE, Direction.LATITUDE],
-                                                       1)
-        # Reload game showing new cities drawn
-        app.switch_frame(GameUI)
+        # The next turn shows the new cities drawn, in the same frame
+        self.wait_turn(app, game)
+        assert app._frame is game
+        assert game.selected is None
+        assert len(game.location_frames) == len(player.hand)
+        # The board and the current hand are the only frames
+        assert len([w for w in game.children.values() if isinstance(w, tk.Frame)]) == 2
+        # The wrong placement is no longer shown
+        assert app.game.board.get(center_x + 1, center_y + 1) is None
+        assert game.cells[(center_x + 1, center_y + 1)] is not highlighted
+        self.pause()
+        # Swap the first city in hand
+        swapped = player.hand[0]
+        game.swap_selected(0)
         self.pump_events(app)
+        assert swapped not in player.hand and len(player.hand) == drawn
+        assert game.selected is None
+        assert len(game.location_frames) == len(player.hand)
+        assert len([w for w in game.children.values() if isinstance(w, tk.Frame)]) == 2
         self.pause()
+        # Place a city in the south east corner, and leave the game
+        # before the next turn
+        size = app.game.board.opts.size
+        game.set_selected(0)
+        game.place_selected(x=size - 1, y=size - 1)
+        assert game._pending_turn is not None
         # Reset player hand
         player.hand = [reykjavik]
-        # Reload game with reset hand
+        # Reload game with reset hand, which cancels the pending turn
         app.switch_frame(GameUI)
+        assert game._pending_turn is None
         self.pump_events(app)
         self.pause()
         # Do an correct placement of reykjavik
@@ -95,11 +157,15 @@ class TestUI:
         game.set_selected(0)
         # Place north west
         game.place_selected(x=center_x - 1, y=center_y - 1)
+        highlighted = game.cells[(center_x - 1, center_y - 1)]
         self.pump_events(app)
         self.pause()
         # Player placed everything
         assert len(player.hand) == 0
-        # Reload game showing that player has won
-        app.switch_frame(GameUI)
-        self.pump_events(app)
+        # The next turn shows that player has won, in the same frame
+        self.wait_turn(app, game)
+        assert app._frame is game
+        assert app.game.board.get(center_x - 1, center_y - 1) == reykjavik
+        assert game.cells[(center_x - 1, center_y - 1)] is not highlighted
+        assert self.find_button(game.hand_frame, msg['back to main']) is not None
         self.pause()